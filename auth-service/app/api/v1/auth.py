@@ -184,7 +184,7 @@ def refresh_token(
         if cached_user_data:
             user_email = cached_user_data["email"]
             user_roles = cached_user_data["roles"]
-            logger.debug(f"Using cached user data for refresh token: {user_id}")
+            logger.debug("Using cached user data for refresh token: %s", user_id)
         else:
             user = user_service.get_user_by_id(user_uuid)
             if not user:
@@ -201,7 +201,7 @@ def refresh_token(
                 email=user.email,
                 roles=user_roles
             )
-            logger.debug(f"Cached user data during refresh token: {user_id}")
+            logger.debug("Cached user data during refresh token: %s", user_id)
         
         refresh_token_repo = RefreshTokenRepository(db)
         refresh_token_record = refresh_token_repo.get_by_token(refresh_data.refresh_token)
@@ -396,6 +396,6 @@ def verify_token(
     response.headers["X-User-Email"] = user_email or ""
     response.headers["X-User-Roles"] = ",".join(user_roles) if user_roles else ""
     
-    logger.debug(f"Token verified successfully for user: {user_email} (ID: {user_id})")
+    logger.debug("Token verified successfully for user: %s (ID: %s)", user_email, user_id)
     
     return response
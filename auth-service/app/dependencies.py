@@ -76,7 +76,7 @@ async def require_auth(
     cached_user_data = session_service.get_user_data(user_id)
     
     if cached_user_data:
-        logger.debug(f"Found cached user data for user: {user_id}")
+        logger.debug("Found cached user data for user: %s", user_id)
         user_service = get_user_service(db)
         user = user_service.get_user_by_id(user_id)
         if not user:
@@ -105,7 +105,7 @@ async def require_auth(
             email=user.email,
             roles=roles
         )
-        logger.debug(f"Cached user data for authenticated user: {user_id}")
+        logger.debug("Cached user data for authenticated user: %s", user_id)
         
         return user
 
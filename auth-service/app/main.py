@@ -1,5 +1,6 @@
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
 from fastapi.exceptions import RequestValidationError
 from starlette.responses import HTMLResponse
 from sqlalchemy.exc import SQLAlchemyError
@@ -13,9 +14,17 @@ from app.core.error_handlers import (
     general_exception_handler
 )
 from app.core.exceptions import BaseServiceException
+from shared.database import warmup
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warmup(redis=True)
+    yield
 
 
 app = FastAPI(
+    lifespan=lifespan,
     docs_url=None,
     title="Auth Service",
     description="Authentication and authorization service",
@@ -44,7 +44,7 @@ class SessionService:
                 user_data_json
             )
             
-            logger.debug(f"Cached user data for user: {user_id}")
+            logger.debug("Cached user data for user: %s", user_id)
             return True
         except Exception as e:
             logger.error(f"Failed to cache user data for user {user_id}: {e}", exc_info=True)
@@ -56,11 +56,11 @@ class SessionService:
             cached_data = self.redis.client.get(cache_key)
             
             if cached_data is None:
-                logger.debug(f"No cached data found for user: {user_id}")
+                logger.debug("No cached data found for user: %s", user_id)
                 return None
             
             user_data = json.loads(cached_data)
-            logger.debug(f"Retrieved cached user data for user: {user_id}")
+            logger.debug("Retrieved cached user data for user: %s", user_id)
             return user_data
         except json.JSONDecodeError as e:
             logger.error(f"Failed to decode cached user data for user {user_id}: {e}")
@@ -76,9 +76,9 @@ class SessionService:
             deleted = self.redis.client.delete(cache_key)
             
             if deleted:
-                logger.debug(f"Invalidated cache for user: {user_id}")
+                logger.debug("Invalidated cache for user: %s", user_id)
             else:
-                logger.debug(f"No cache entry found to invalidate for user: {user_id}")
+                logger.debug("No cache entry found to invalidate for user: %s", user_id)
             
             return bool(deleted)
         except Exception as e:
@@ -1,4 +1,3 @@
-import json
 import asyncio
 import os
 from typing import Optional, Dict, Any
@@ -7,7 +6,7 @@ from uuid import UUID
 import aio_pika
 from shared.logging_config import get_logger
 from shared.config import get_settings
-from shared.rabbitmq import RabbitMQConsumer, RabbitMQConnection
+from shared.rabbitmq import RabbitMQConsumer, RabbitMQConnection, MessageDecodeError, decode_message_body
 from shared.models import InventoryMessage, MessageType
 from app.core.database import get_db_manager
 from app.repositories.order_repository import OrderRepository
@@ -174,7 +173,7 @@ class InventoryEventConsumer:
     
     async def _process_message_async(self, message: aio_pika.IncomingMessage):
         try:
-            message_data = json.loads(message.body.decode('utf-8'))
+            message_data = decode_message_body(message)
             message_type = message_data.get("message_type")
             routing_key = message.routing_key or message_type
             
@@ -201,7 +200,7 @@ class InventoryEventConsumer:
                 logger.error(f"Failed to process message {message_data.get('message_id', 'unknown')} after retries")
                 await message.nack(requeue=False)
                 
-        except json.JSONDecodeError as e:
+        except MessageDecodeError as e:
             logger.error(f"Failed to decode message: {e}")
             await message.nack(requeue=False)
         except Exception as e:
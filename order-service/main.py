@@ -13,7 +13,7 @@ from shared.config import get_settings
 settings = get_settings()
 setup_logging(service_name=os.getenv("SERVICE_NAME", "order-service"), log_level=settings.app.log_level)
 logger = get_logger(__name__, os.getenv("SERVICE_NAME", "order-service"))
-logger.debug(f'log level: {settings.app.log_level}')
+logger.debug('log level: %s', settings.app.log_level)
 
 
 @asynccontextmanager
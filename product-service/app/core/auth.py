@@ -78,7 +78,7 @@ def require_auth(f):
             return response, 401
         
         kwargs["current_user"] = user_data
-        logger.debug(f"Authenticated user: {user_data.get('sub')} (roles: {user_data.get('roles', [])})")
+        logger.debug("Authenticated user: %s (roles: %s)", user_data.get('sub'), user_data.get('roles', []))
         return f(*args, **kwargs)
     
     return decorated_function
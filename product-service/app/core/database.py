@@ -6,21 +6,22 @@ from shared.config import get_settings
 settings = get_settings()
 
 if TYPE_CHECKING:
-    from motor.motor_asyncio import AsyncIOMotorDatabase
+    from pymongo.asynchronous.database import AsyncDatabase
 
 logger = get_logger(__name__, settings.app.service_name)
 
 
 class ProductDatabaseManager:
     
-    def __init__(self):
-        self.mongo = get_async_mongo()
+    @property
+    def mongo(self):
+        return get_async_mongo()
     
     async def connect(self):
         await self.mongo.connect()
     
     @property
-    def database(self) -> "AsyncIOMotorDatabase":
+    def database(self) -> "AsyncDatabase":
         return self.mongo.database
     
     @property
@@ -66,7 +67,7 @@ def get_db_manager() -> ProductDatabaseManager:
     return _db_manager
 
 
-async def get_database() -> "AsyncIOMotorDatabase":
+async def get_database() -> "AsyncDatabase":
     db_manager = get_db_manager()
     if db_manager.mongo._database is None or not db_manager.mongo._is_client_valid_for_current_loop():
         await db_manager.connect()
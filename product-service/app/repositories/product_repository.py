@@ -1,7 +1,7 @@
 from typing import Optional, List, Dict, Any
 from bson import ObjectId
 from bson.errors import InvalidId
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from datetime import datetime, timezone
 import os
 from shared.logging_config import get_logger
@@ -13,7 +13,7 @@ logger = get_logger(__name__, os.getenv("SERVICE_NAME"))
 
 class ProductRepository:
     
-    def __init__(self, database: AsyncIOMotorDatabase):
+    def __init__(self, database: AsyncDatabase):
         self.db = database
         self.collection = database.products
     
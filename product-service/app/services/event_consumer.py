@@ -1,4 +1,3 @@
-import json
 import asyncio
 from typing import Optional, Dict, Any, Callable
 from datetime import datetime
@@ -7,7 +6,7 @@ import os
 import aio_pika
 from shared.logging_config import get_logger
 from shared.config import get_settings
-from shared.rabbitmq import RabbitMQConsumer, RabbitMQConnection
+from shared.rabbitmq import RabbitMQConsumer, RabbitMQConnection, MessageDecodeError, decode_message_body
 from shared.models import OrderMessage, MessageType
 from app.core.database import get_database
 from app.repositories.product_repository import ProductRepository
@@ -283,7 +282,7 @@ class OrderEventConsumer:
     
     async def _process_message_async(self, message: aio_pika.IncomingMessage):
         try:
-            message_data = json.loads(message.body.decode('utf-8'))
+            message_data = decode_message_body(message)
             message_type = message_data.get("message_type")
             routing_key = message.routing_key or message_type
             
@@ -317,7 +316,7 @@ class OrderEventConsumer:
                 logger.error(f"Failed to process message {message_data.get('message_id', 'unknown')} after retries")
                 await message.nack(requeue=False)
                 
-        except json.JSONDecodeError as e:
+        except MessageDecodeError as e:
             logger.error(f"Failed to decode message: {e}")
             await message.nack(requeue=False)
         except Exception as e:
@@ -38,14 +38,17 @@ class ProductEventPublisher:
                 return None
         return self._publisher
     
-    async def publish_event(self, message, routing_key: str):
+    async def publish_event(self, message, routing_key: str, confirm: bool = True):
         try:
             publisher = await self._get_publisher()
             if publisher is None:
                 logger.debug("RabbitMQ publisher not available, skipping event publish")
                 return
             
-            await publisher.publish(message, routing_key=routing_key)
+            if confirm:
+                await publisher.publish(message, routing_key=routing_key)
+            else:
+                await publisher.publish_fire_and_forget(message, routing_key=routing_key)
         except Exception as e:
             logger.error(f"Error publishing event: {e}", exc_info=True)
     
@@ -91,7 +94,7 @@ class ProductEventPublisher:
                     "updated_by": product.updated_by
                 }
             )
-            await self.publish_event(message, "product.updated")
+            await self.publish_event(message, "product.updated", confirm=False)
         except Exception as e:
             logger.error(f"Failed to create product.updated event: {e}", exc_info=True)
     
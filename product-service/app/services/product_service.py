@@ -1,6 +1,6 @@
 import uuid
 from typing import Optional, TYPE_CHECKING
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 import os
 from shared.logging_config import get_logger
 from app.models import Product, ProductStatus
@@ -212,7 +212,7 @@ class ProductService:
 
     
 async def get_product_service(
-    database: Optional[AsyncIOMotorDatabase] = None,
+    database: Optional[AsyncDatabase] = None,
     repository: Optional[ProductRepository] = None,
     event_publisher: Optional["ProductEventPublisher"] = None
 ) -> ProductService:
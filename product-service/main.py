@@ -5,6 +5,7 @@ import asyncio
 from app.core.database import get_db_manager
 from app.api.v1.products import bp as products_bp
 from app.services.event_consumer import get_event_consumer
+from app.utils import run_async
 from shared.logging_config import setup_logging, get_logger
 from shared.config import get_settings
 
@@ -30,7 +31,8 @@ def create_app(config=None, init_db=True):
     def health_check():
         try:
             db_manager = get_db_manager()
-            is_healthy = asyncio.run(db_manager.health_check())
+            # Reuse the thread's persistent loop so each probe doesn't leave a new Mongo client behind
+            is_healthy = run_async(db_manager.health_check())
             if is_healthy:
                 return jsonify({
                     "status": "healthy",
@@ -60,8 +62,12 @@ def create_app(config=None, init_db=True):
 
 async def _init_database_async():
     db_manager = get_db_manager()
-    await db_manager.connect()
-    await db_manager.create_indexes()
+    try:
+        await db_manager.connect()
+        await db_manager.create_indexes()
+    finally:
+        # asyncio.run() closes this loop on return, so close its client while it can still run
+        await db_manager.close()
 
 def _init_database():
     try:
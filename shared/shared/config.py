@@ -1,21 +1,31 @@
 from typing import Optional
-from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
+import orjson
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os
-from dotenv import load_dotenv
+import importlib.util
 import logging
-import json
+import hashlib
+import tempfile
+import time
 
 logger = logging.getLogger(__name__)
 
-try:
-    from google.cloud import secretmanager
-    GCP_AVAILABLE = True
-except ImportError:
-    GCP_AVAILABLE = False
-    logger.warning("google-cloud-secret-manager not installed. GCP Secret Manager will not be available.")
+GCP_AVAILABLE: Optional[bool] = None
+
+
+def _gcp_available() -> bool:
+    global GCP_AVAILABLE
+    if GCP_AVAILABLE is None:
+        try:
+            GCP_AVAILABLE = importlib.util.find_spec("google.cloud.secretmanager") is not None
+        except ImportError:
+            GCP_AVAILABLE = False
+        if not GCP_AVAILABLE:
+            logger.warning("google-cloud-secret-manager not installed. GCP Secret Manager will not be available.")
+    return GCP_AVAILABLE
 
 
 class AuthDatabaseSettings(BaseSettings):
@@ -25,6 +35,8 @@ class AuthDatabaseSettings(BaseSettings):
     pool_size: int
     max_overflow: int
     pool_timeout: int
+    pool_min_size: Optional[int] = None
+    driver: str = "psycopg2"
 
 class OrderDatabaseSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="POSTGRES_ORDER_")
@@ -33,12 +45,16 @@ class OrderDatabaseSettings(BaseSettings):
     pool_size: int
     max_overflow: int
     pool_timeout: int
+    pool_min_size: Optional[int] = None
+    driver: str = "psycopg2"
 
 class MongoSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="MONGODB_")
     
     url: str
     database: str
+    driver: str = "pymongo"
+    validate_on_connect: bool = False
 
 
 class RedisSettings(BaseSettings):  
@@ -48,6 +64,7 @@ class RedisSettings(BaseSettings):
     decode_responses: bool
     socket_timeout: int
     socket_connect_timeout: int
+    pool_size: int = 50
 
 
 class RabbitMQSettings(BaseSettings):
@@ -57,6 +74,7 @@ class RabbitMQSettings(BaseSettings):
     exchange: str
     queue_prefix: str
     prefetch_count: int
+    wire_format: str = "json"
 
 
 class AppSettings(BaseSettings):
@@ -76,9 +94,11 @@ class AppSettings(BaseSettings):
 
 def load_gcp_secrets(project_id: str, secret_names: Optional[list[str]] = None, secret_prefix: Optional[str] = None) -> dict[str, str]:
 
-    if not GCP_AVAILABLE:
+    if not _gcp_available():
         raise ImportError("google-cloud-secret-manager is not installed")
     
+    from google.cloud import secretmanager
+
     secrets = {}
     try:
         client = secretmanager.SecretManagerServiceClient()
@@ -102,50 +122,186 @@ def load_gcp_secrets(project_id: str, secret_names: Optional[list[str]] = None,
     
     if secret_prefix:
         try:
-            for secret in client.list_secrets(request={"parent": parent}):
-                if secret.name.split("/")[-1].startswith(secret_prefix):
-                    secret_name = secret.name.split("/")[-1]
-                    try:
-                        name = f"{secret.name}/versions/latest"
-                        response = client.access_secret_version(request={"name": name})
-                        secrets[secret_name] = response.payload.data.decode("UTF-8")
-                        logger.debug(f"Loaded secret: {secret_name}")
-                    except Exception as e:
-                        logger.debug(f"Could not load secret {secret_name}: {e}")
+            names = [
+                secret.name.split("/")[-1]
+                for secret in client.list_secrets(request={"parent": parent})
+                if secret.name.split("/")[-1].startswith(secret_prefix)
+            ]
         except Exception as e:
             logger.warning(f"Could not list secrets with prefix {secret_prefix}: {e}")
+            return secrets
+    else:
+        names = list(dict.fromkeys(secret_names or []))
+
+    for secret_name, result in _fetch_versions_parallel(client, parent, names).items():
+        if isinstance(result, Exception):
+            error_msg = str(result)
+            if "permission" in error_msg.lower() or "not found" in error_msg.lower() or "does not exist" in error_msg.lower():
+                logger.warning(f"Could not load secret '{secret_name}': {error_msg}")
+            else:
+                logger.debug("Could not load secret '%s': %s", secret_name, error_msg)
+        else:
+            secrets[secret_name] = result
+            logger.debug("Loaded secret: %s", secret_name)
+
+    return secrets
+
+
+def _fetch_versions_parallel(client, parent: str, names: list[str]) -> dict[str, str | Exception]:
 
-        return secrets
+    def access_latest(secret_name: str) -> str:
+        response = client.access_secret_version(
+            request={"name": f"{parent}/secrets/{secret_name}/versions/latest"}
+        )
+        return response.payload.data.decode("UTF-8")
 
-    if secret_names:
+    results: dict[str, str | Exception] = {}
+    if not names:
+        return results
 
-        for secret_name in secret_names:
+    with ThreadPoolExecutor(max_workers=min(32, len(names))) as executor:
+        futures = {executor.submit(access_latest, secret_name): secret_name for secret_name in names}
+        for future, secret_name in futures.items():
             try:
-                name = f"{parent}/secrets/{secret_name}/versions/latest"
-                response = client.access_secret_version(request={"name": name})
-                secrets[secret_name] = response.payload.data.decode("UTF-8")
-                logger.debug(f"Loaded secret: {secret_name}")
+                results[secret_name] = future.result()
             except Exception as e:
-                error_msg = str(e)
-                if "permission" in error_msg.lower() or "not found" in error_msg.lower() or "does not exist" in error_msg.lower():
-                    logger.warning(f"Could not load secret '{secret_name}': {error_msg}")
-                else:
-                    logger.debug(f"Could not load secret '{secret_name}': {error_msg}")
-    
+                results[secret_name] = e
 
-    return secrets
+    return results
+
+
+def _flatten_secrets(secrets: dict[str, str]) -> dict[str, str]:
+
+    parsed_secrets = {}
+    for secret_name, secret_value in secrets.items():
+        json_data = None
+        if secret_value.lstrip().startswith("{"):
+            try:
+                json_data = orjson.loads(secret_value)
+            except orjson.JSONDecodeError:
+                pass
+        if isinstance(json_data, dict):
+            logger.debug("Parsing JSON secret: %s", secret_name)
+            parsed_secrets.update((key, str(value)) for key, value in json_data.items())
+        else:
+            parsed_secrets[secret_name] = secret_value
+    return parsed_secrets
+
+
+def _load_parsed_gcp_secrets(project_id: str, secret_names: Optional[list[str]], secret_prefix: Optional[str]) -> dict[str, str]:
+
+    fernet = _get_secret_cache_fernet()
+    cache_path = _secret_cache_path(project_id, secret_names, secret_prefix)
+    if fernet is not None:
+        cached = _read_secret_cache(cache_path, fernet)
+        if cached is not None:
+            logger.info(f"Loaded {len(cached)} secrets from local cache")
+            return cached
+
+    secrets = load_gcp_secrets(
+        project_id=project_id,
+        secret_names=secret_names,
+        secret_prefix=secret_prefix
+    )
+
+    if not secrets:
+        logger.warning(f"No secrets found in GCP Secret Manager. Check project_id: {project_id}, secret_names: {secret_names}, secret_prefix: {secret_prefix}")
+
+    parsed_secrets = _flatten_secrets(secrets)
+
+    if fernet is not None and parsed_secrets:
+        _write_secret_cache(cache_path, fernet, parsed_secrets)
+
+    return parsed_secrets
+
+
+def _get_secret_cache_fernet():
+
+    cache_key = os.getenv("SECRET_CACHE_KEY")
+    if not cache_key:
+        return None
+    try:
+        from cryptography.fernet import Fernet
+        return Fernet(cache_key)
+    except ImportError:
+        logger.warning("cryptography not installed. GCP secret cache is disabled.")
+    except ValueError as e:
+        logger.warning(f"Invalid SECRET_CACHE_KEY, GCP secret cache is disabled: {e}")
+    return None
+
+
+def _secret_cache_path(project_id: str, secret_names: Optional[list[str]], secret_prefix: Optional[str]) -> Path:
+
+    cache_id = orjson.dumps([project_id, sorted(secret_names or []), secret_prefix or ""])
+    digest = hashlib.blake2b(cache_id, digest_size=16).hexdigest()
+    return Path(tempfile.gettempdir()) / f"gcp_env_{digest}.json.enc"
+
+
+def _read_secret_cache(cache_path: Path, fernet) -> Optional[dict[str, str]]:
+
+    ttl = int(os.getenv("SECRET_CACHE_TTL", "3600"))
+    try:
+        if time.time() - cache_path.stat().st_mtime > ttl:
+            logger.debug("GCP secret cache expired: %s", cache_path)
+            return None
+        return orjson.loads(fernet.decrypt(cache_path.read_bytes()))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Could not read GCP secret cache %s: %s", cache_path, e)
+        return None
+
+
+def _write_secret_cache(cache_path: Path, fernet, secrets: dict) -> None:
+
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(fernet.encrypt(orjson.dumps(secrets)))
+        os.replace(tmp_path, cache_path)
+        logger.debug("Wrote GCP secret cache: %s", cache_path)
+    except OSError as e:
+        logger.debug("Could not write GCP secret cache %s: %s", cache_path, e)
+
+
+@lru_cache(maxsize=4)
+def _read_dotenv(path: str, mtime: float) -> dict[str, Optional[str]]:
+    from dotenv import dotenv_values
+
+    return dotenv_values(dotenv_path=path)
+
+
+_ENV_LOADED = False
 
 
 def load_environment_variables():
 
-    environment = os.getenv("ENVIRONMENT", "development").lower()
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _load_environment_variables()
+    _ENV_LOADED = True
+
+
+def reload_environment_variables():
+
+    global _ENV_LOADED
+    _ENV_LOADED = False
+    load_environment_variables()
+
+
+def _load_environment_variables():
+
+    if (
+        os.environ.get("USE_GCP_SECRETS", "false").lower() != "true"
+        and os.environ.get("ENVIRONMENT", "development").lower() != "production"
+    ):
+        _load_dotenv_fast()
+        return
+
     gcp_project_id = os.getenv("GCP_PROJECT_ID")
-    use_gcp = (
-        environment == "production" or 
-        (gcp_project_id and os.getenv("USE_GCP_SECRETS", "false").lower() == "true")
-    )
-    
-    if use_gcp and gcp_project_id and GCP_AVAILABLE:
+    if gcp_project_id and _gcp_available():
         try:
             logger.info(f"Loading secrets from GCP Secret Manager for project: {gcp_project_id}")
             
@@ -155,33 +311,12 @@ def load_environment_variables():
             if secret_names:
                 secret_names = [name.strip() for name in secret_names]
 
-            secrets = load_gcp_secrets(
-                project_id=gcp_project_id,
-                secret_names=secret_names,
-                secret_prefix=secret_prefix
-            )
-
-            if not secrets:
-                logger.warning(f"No secrets found in GCP Secret Manager. Check project_id: {gcp_project_id}, secret_names: {secret_names}, secret_prefix: {secret_prefix}")
-            
-            parsed_secrets = {}
-            for secret_name, secret_value in secrets.items():
-                try:
-                    json_data = json.loads(secret_value)
-                    if isinstance(json_data, dict):
-                        logger.debug(f"Parsing JSON secret: {secret_name}")
-                        for key, value in json_data.items():
-                            parsed_secrets[key] = str(value)
-                    else:
-                        parsed_secrets[secret_name] = secret_value
-                except (json.JSONDecodeError, ValueError):
-                    parsed_secrets[secret_name] = secret_value
+            parsed_secrets = _load_parsed_gcp_secrets(gcp_project_id, secret_names, secret_prefix)
             
             if not parsed_secrets:
                 logger.warning("No secrets were loaded from GCP Secret Manager. Check secret names and authentication.")
             else:
-                for key, value in parsed_secrets.items():
-                    os.environ[key] = value
+                os.environ.update(parsed_secrets)
                 logger.info(f"Loaded {len(parsed_secrets)} secrets from GCP Secret Manager")
         except Exception as e:
             error_msg = str(e)
@@ -195,12 +330,33 @@ def load_environment_variables():
             logger.warning("Falling back to .env file or existing environment variables")
             raise Exception(f"Failed to load secrets from GCP Secret Manager: {error_msg}")
     else:
-        _env_file = Path(__file__).parent / ".env"
-        if _env_file.exists():
-            logger.debug(f"Loading environment variables from .env file: {_env_file}")
-            load_dotenv(dotenv_path=_env_file)
-        else:
-            logger.debug(".env file not found, using existing environment variables")
+        _load_dotenv_fast()
+
+
+def _load_dotenv_fast():
+
+    _env_file = Path(__file__).parent / ".env"
+    try:
+        mtime = _env_file.stat().st_mtime
+    except FileNotFoundError:
+        logger.debug(".env file not found, using existing environment variables")
+        return
+
+    logger.debug("Loading environment variables from .env file: %s", _env_file)
+    os.environ.update({
+        key: value
+        for key, value in _read_dotenv(str(_env_file), mtime).items()
+        if value is not None and key not in os.environ
+    })
+
+
+_NESTED_SETTINGS = (
+    ("authDatabase", AuthDatabaseSettings),
+    ("orderDatabase", OrderDatabaseSettings),
+    ("mongodb", MongoSettings),
+    ("redis", RedisSettings),
+    ("rabbitmq", RabbitMQSettings),
+)
 
 
 class Settings(BaseSettings):
@@ -211,48 +367,63 @@ class Settings(BaseSettings):
     mongodb: Optional[MongoSettings] = None
     redis: Optional[RedisSettings] = None
     rabbitmq: Optional[RabbitMQSettings] = None
-    app: AppSettings = Field(default_factory=AppSettings)
+    app: AppSettings
     
     def __init__(self, **kwargs):
 
         load_environment_variables()
 
+        # One os.environ snapshot feeds every nested settings class
+        env = dict(os.environ)
+
+        for field_name, settings_cls in _NESTED_SETTINGS:
+            if kwargs.get(field_name) is None:
+                kwargs[field_name] = _settings_from_env(settings_cls, env)
+        if "app" not in kwargs:
+            kwargs["app"] = AppSettings.model_validate(_env_values(AppSettings, env))
+
         super().__init__(**kwargs)
     
-    @model_validator(mode='after')
-    def create_nested_settings(self):
-
-        if os.getenv("POSTGRES_AUTH_URL"):
-            try:
-                self.authDatabase = AuthDatabaseSettings()
-            except Exception:
-                pass
-        
-        if os.getenv("POSTGRES_ORDER_URL"):
-            try:
-                self.orderDatabase = OrderDatabaseSettings()
-            except Exception:
-                pass
-        
-        if os.getenv("MONGODB_URL") and os.getenv("MONGODB_DATABASE"):
-            try:
-                self.mongodb = MongoSettings()
-            except Exception:
-                pass
-        
-        if os.getenv("REDIS_URL"):
-            try:
-                self.redis = RedisSettings()
-            except Exception:
-                pass
-        
-        if os.getenv("RABBITMQ_URL"):
-            try:
-                self.rabbitmq = RabbitMQSettings()
-            except Exception:
-                pass
-        
-        return self
+    @classmethod
+    def settings_customise_sources(cls, settings_cls, init_settings, env_settings, dotenv_settings, file_secret_settings):
+        # Nested settings are resolved from the snapshot in __init__
+        return (init_settings,)
+
+
+def _env_values(settings_cls: type[BaseSettings], env: dict[str, str]) -> dict[str, str]:
+
+    prefix = settings_cls.model_config.get("env_prefix", "")
+    values = {}
+    for field_name in settings_cls.model_fields:
+        value = env.get(f"{prefix}{field_name}".upper())
+        if value is not None:
+            values[field_name] = value
+    return values
+
+
+def _settings_from_env(settings_cls: type[BaseSettings], env: dict[str, str]) -> Optional[BaseSettings]:
+
+    prefix = settings_cls.model_config.get("env_prefix", "")
+    if not env.get(f"{prefix}URL"):
+        return None
+
+    # An empty value falls back to the field's default; required fields get it as-is, like pydantic-settings
+    fields = settings_cls.model_fields
+    values = {
+        name: value for name, value in _env_values(settings_cls, env).items()
+        if value or fields[name].is_required()
+    }
+    missing = [
+        f"{prefix}{field_name}".upper()
+        for field_name, field in fields.items()
+        if field.is_required() and field_name not in values
+    ]
+
+    if missing:
+        logger.warning(f"{settings_cls.__name__} not configured, missing environment variables: {', '.join(missing)}")
+        return None
+    # Validation still runs BaseSettings.__init__, whose env source would hand an empty optional value back
+    return settings_cls(_env_ignore_empty=True, **values)
 
 
 @lru_cache()
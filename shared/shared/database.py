@@ -1,270 +1,591 @@
-from typing import Optional
-from contextlib import contextmanager
-from psycopg2 import pool
-from psycopg2.extras import RealDictCursor
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
-from redis import Redis
-from redis.exceptions import ConnectionError as RedisConnectionError
+from typing import Any, Optional, Sequence, TYPE_CHECKING
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from shared.config import get_settings
 from shared.logging_config import get_logger
 
 import asyncio
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+import inspect
+import threading
+import weakref
 
+if TYPE_CHECKING:
+    import asyncpg
+    import psycopg_pool
+    from shared.config import Settings
+    from psycopg2 import pool
+    from redis import BlockingConnectionPool, Redis
+    from pymongo import AsyncMongoClient
+    from pymongo.asynchronous.database import AsyncDatabase
 
-settings = get_settings()
-logger = get_logger(__name__, settings.app.service_name)
+
+_settings: Optional["Settings"] = None
+
+
+def _current_settings() -> "Settings":
+    global _settings
+    if _settings is None:
+        _settings = get_settings()
+    return _settings
+
+
+def set_settings(settings: "Settings") -> None:
+    global _settings
+    _settings = settings
+    _get_logger.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _get_logger():
+    return get_logger(__name__, _current_settings().app.service_name)
+
+
+# Substrings of the RuntimeError asyncio raises when a future is awaited from another loop
+_LOOP_TOKENS = ("different loop", "attached to a different")
+
+
+def _current_event_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    try:
+        return asyncio.get_event_loop()
+    except RuntimeError:
+        return None
+
+
+# Settings attribute for each Postgres database the services use
+_POSTGRES_DATABASES = {"auth": "authDatabase", "order": "orderDatabase"}
+
+
+def _postgres_settings(database: str):
+    if database not in _POSTGRES_DATABASES:
+        raise ValueError(f"Unknown PostgreSQL database {database!r}; expected one of {sorted(_POSTGRES_DATABASES)}")
+    database_settings = getattr(_current_settings(), _POSTGRES_DATABASES[database])
+    if database_settings is None:
+        raise ValueError(
+            "PostgreSQL settings are not configured. "
+            f"Please set POSTGRES_{database.upper()}_URL environment variable."
+        )
+    return database_settings
+
+
+def _pool_min_size(database_settings) -> int:
+    if database_settings.pool_min_size is not None:
+        return min(database_settings.pool_min_size, database_settings.pool_size)
+    return min(5, database_settings.pool_size)
+
+
+class _PooledConnection:
+    # Plain context manager rather than @contextmanager: no generator frame per borrow
+    __slots__ = ("_pool", "conn")
+    
+    def __init__(self, connection_pool: "pool.ThreadedConnectionPool"):
+        self._pool = connection_pool
+        self.conn = None
+    
+    def __enter__(self):
+        try:
+            self.conn = self._pool.getconn()
+        except Exception as e:
+            _get_logger().error(f"Database connection error: {e}")
+            raise
+        return self.conn
+    
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is not None:
+                self.conn.rollback()
+                _get_logger().error(f"Database connection error: {exc}")
+        finally:
+            self._pool.putconn(self.conn)
+        return False
+
+
+class _PooledCursor:
+    __slots__ = ("_connection", "_cursor_kwargs", "_itersize", "cursor")
+    
+    def __init__(self, connection: _PooledConnection, cursor_kwargs: dict, itersize: Optional[int] = None):
+        self._connection = connection
+        self._cursor_kwargs = cursor_kwargs
+        self._itersize = itersize
+        self.cursor = None
+    
+    def __enter__(self):
+        conn = self._connection.__enter__()
+        try:
+            self.cursor = conn.cursor(**self._cursor_kwargs)
+            if self._itersize is not None:
+                self.cursor.itersize = self._itersize
+        except BaseException as e:
+            self._connection.__exit__(type(e), e, e.__traceback__)
+            raise
+        return self.cursor
+    
+    def __exit__(self, exc_type, exc, tb):
+        conn = self._connection.conn
+        commit_error = None
+        try:
+            if exc_type is None:
+                try:
+                    conn.commit()
+                except Exception as e:
+                    commit_error = e
+                    exc_type, exc, tb = type(e), e, e.__traceback__
+            if exc_type is not None:
+                conn.rollback()
+                _get_logger().error(f"Database cursor error: {exc}")
+        finally:
+            self.cursor.close()
+            self._connection.__exit__(exc_type, exc, tb)
+        if commit_error is not None:
+            raise commit_error
+        return False
 
 
 class PostgreSQLConnection:
     
-    def __init__(self, connection_url: Optional[str] = None):
-        self.settings = get_settings()
-        if self.settings.database is None:
-            raise ValueError(
-                "PostgreSzL settings are not configured. "
-                "Please set DATABASE_URL environment variable."
-            )
-        self.connection_url = connection_url or self.settings.database.url
-        self._pool: Optional[pool.ThreadedConnectionPool] = None
+    def __init__(self, connection_url: Optional[str] = None, database: str = "auth"):
+        self.database_settings = _postgres_settings(database)
+        self.connection_url = connection_url or self.database_settings.url
+        self.driver = self.database_settings.driver
+        self._pool = None
+        # Statement names PREPAREd per pooled connection; entries go away with connections the pool discards
+        self._prepared: "weakref.WeakKeyDictionary[Any, set[str]]" = weakref.WeakKeyDictionary()
     
     def create_pool(self):
-        if self._pool is None:
+        if self._pool is None and self.driver == "psycopg":
+            self._pool = self._create_psycopg_pool()
+        elif self._pool is None:
+            from psycopg2 import pool
+
+            settings = _current_settings()
             try:
-                self._pool = pool.ThreadedConnectionPool(
-                    minconn=1,
-                    maxconn=self.settings.database.pool_size,
-                    dsn=self.connection_url
+                connection_pool = pool.ThreadedConnectionPool(
+                    minconn=_pool_min_size(self.database_settings),
+                    maxconn=self.database_settings.pool_size,
+                    dsn=self.connection_url,
+                    keepalives=1,
+                    keepalives_idle=30,
+                    keepalives_interval=10,
+                    keepalives_count=5,
+                    application_name=settings.app.service_name
                 )
-                logger.info("PostgreSQL connection pool created successfully")
+                try:
+                    self._ping_idle_connections(connection_pool)
+                except Exception:
+                    connection_pool.closeall()
+                    raise
+                self._pool = connection_pool
+                _get_logger().info("PostgreSQL connection pool created successfully")
             except Exception as e:
-                logger.error(f"Failed to create PostgreSQL connection pool: {e}")
+                _get_logger().error(f"Failed to create PostgreSQL connection pool: {e}")
                 raise
     
-    @contextmanager
-    def get_connection(self):
-        if self._pool is None:
-            self.create_pool()
-        
-        conn = None
+    def _create_psycopg_pool(self) -> "psycopg_pool.ConnectionPool":
+        from psycopg_pool import ConnectionPool
+
+        settings = _current_settings()
         try:
-            conn = self._pool.getconn()
-            yield conn
+            connection_pool = ConnectionPool(
+                self.connection_url,
+                min_size=_pool_min_size(self.database_settings),
+                max_size=self.database_settings.pool_size,
+                kwargs={
+                    "prepare_threshold": 0,
+                    "keepalives": 1,
+                    "keepalives_idle": 30,
+                    "keepalives_interval": 10,
+                    "keepalives_count": 5,
+                    "application_name": settings.app.service_name,
+                },
+                open=False
+            )
+            # Blocks until min_size connections are open, so start-up fails fast like the psycopg2 ping
+            connection_pool.open(wait=True)
+            _get_logger().info("PostgreSQL (psycopg) connection pool created successfully")
+            return connection_pool
         except Exception as e:
-            if conn:
-                conn.rollback()
-            logger.error(f"Database connection error: {e}")
+            _get_logger().error(f"Failed to create PostgreSQL (psycopg) connection pool: {e}")
             raise
+    
+    @staticmethod
+    def _ping_idle_connections(connection_pool: "pool.ThreadedConnectionPool"):
+        conns = [connection_pool.getconn() for _ in range(connection_pool.minconn)]
+        try:
+            for conn in conns:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                conn.rollback()
         finally:
-            if conn:
-                self._pool.putconn(conn)
+            for conn in conns:
+                connection_pool.putconn(conn)
+    
+    def get_connection(self) -> "_PooledConnection":
+        if self._pool is None:
+            self.create_pool()
+        return _PooledConnection(self._pool)
     
-    @contextmanager
-    def get_cursor(self, dict_cursor: bool = True):
-        with self.get_connection() as conn:
-            cursor = conn.cursor(cursor_factory=RealDictCursor if dict_cursor else None)
+    def get_cursor(self, dict_cursor: bool = True) -> "_PooledCursor":
+        if not dict_cursor:
+            cursor_kwargs = {}
+        elif self.driver == "psycopg":
+            from psycopg.rows import dict_row
+
+            cursor_kwargs = {"row_factory": dict_row}
+        else:
+            from psycopg2.extras import RealDictCursor
+
+            cursor_kwargs = {"cursor_factory": RealDictCursor}
+        return _PooledCursor(self.get_connection(), cursor_kwargs)
+    
+    def get_binary_cursor(self, name: Optional[str] = None, itersize: int = 2000) -> "_PooledCursor":
+        # Tuple rows; pass a name for a server-side cursor fetching itersize rows per round-trip
+        cursor_kwargs = {"name": name} if name else {}
+        if self.driver == "psycopg":
+            cursor_kwargs["binary"] = True
+        # itersize only exists on named cursors (psycopg 3 client cursors have no such attribute)
+        return _PooledCursor(self.get_connection(), cursor_kwargs, itersize if name else None)
+    
+    def execute_prepared(self, cursor, name: str, sql: str, params: Sequence[Any] = ()):
+        # sql uses $1..$n placeholders; it is PREPAREd once per pooled connection, then only EXECUTEd
+        if not name.isidentifier():
+            raise ValueError(f"Invalid prepared statement name: {name!r}")
+        
+        prepared = self._prepared.setdefault(cursor.connection, set())
+        if name not in prepared:
+            cursor.execute(f"PREPARE {name} AS {sql}")
+            prepared.add(name)
+        
+        if params:
+            cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        else:
+            cursor.execute(f"EXECUTE {name}")
+    
+    def execute_values(self, cursor, sql: str, rows, page_size: int = 500, fetch: bool = False):
+        # Same contract as execute_values_fast, for either driver; page_size only applies to psycopg2
+        if self.driver == "psycopg":
+            return _executemany_values(cursor, sql, rows, fetch=fetch)
+        return execute_values_fast(cursor, sql, rows, page_size=page_size, fetch=fetch)
+    
+    def close_pool(self):
+        self._prepared.clear()
+        if self._pool:
+            if self.driver == "psycopg":
+                self._pool.close()
+            else:
+                self._pool.closeall()
+            self._pool = None
+            _get_logger().info("PostgreSQL connection pool closed")
+
+
+def execute_values_fast(cursor, sql: str, rows, page_size: int = 500, fetch: bool = False):
+    # One multi-row INSERT per page instead of one round-trip per row; sql takes a single VALUES %s
+    if type(cursor).__module__.startswith("psycopg."):
+        raise TypeError(
+            "execute_values_fast() needs a psycopg2 cursor; "
+            "use PostgreSQLConnection.execute_values() with POSTGRES_*_DRIVER=psycopg"
+        )
+    from psycopg2.extras import execute_values
+
+    return execute_values(cursor, sql, rows, page_size=page_size, fetch=fetch)
+
+
+def _executemany_values(cursor, sql: str, rows, fetch: bool = False):
+    # psycopg 3 has no mogrify-based execute_values; executemany pipelines one row per statement instead
+    rows = list(rows)
+    if not rows:
+        return [] if fetch else None
+    
+    row_placeholders = "(" + ", ".join(["%s"] * len(rows[0])) + ")"
+    query = sql.replace("%s", row_placeholders, 1)
+    cursor.executemany(query, rows, returning=fetch)
+    if not fetch:
+        return None
+    
+    results = []
+    while True:
+        results.extend(cursor.fetchall())
+        if not cursor.nextset():
+            return results
+
+
+class AsyncPostgreSQLConnection:
+    
+    def __init__(self, connection_url: Optional[str] = None, database: str = "auth"):
+        self.database_settings = _postgres_settings(database)
+        self.connection_url = connection_url or self.database_settings.url
+        self._pool: Optional["asyncpg.Pool"] = None
+    
+    async def create_pool(self):
+        if self._pool is None:
+            import asyncpg
+
+            settings = _current_settings()
             try:
-                yield cursor
-                conn.commit()
+                self._pool = await asyncpg.create_pool(
+                    dsn=self.connection_url,
+                    min_size=_pool_min_size(self.database_settings),
+                    max_size=self.database_settings.pool_size,
+                    max_inactive_connection_lifetime=300,
+                    server_settings={"application_name": settings.app.service_name}
+                )
+                _get_logger().info("PostgreSQL async connection pool created successfully")
             except Exception as e:
-                conn.rollback()
-                logger.error(f"Database cursor error: {e}")
+                _get_logger().error(f"Failed to create PostgreSQL async connection pool: {e}")
                 raise
-            finally:
-                cursor.close()
     
-    def close_pool(self):
+    @asynccontextmanager
+    async def acquire(self):
+        if self._pool is None:
+            await self.create_pool()
+        
+        async with self._pool.acquire() as conn:
+            yield conn
+    
+    async def close_pool(self):
         if self._pool:
-            self._pool.closeall()
+            await self._pool.close()
             self._pool = None
-            logger.info("PostgreSQL connection pool closed")
+            _get_logger().info("PostgreSQL async connection pool closed")
 
 
 class AsyncMongoDBConnection:
     
     def __init__(self, connection_url: Optional[str] = None):
-        self.settings = get_settings()
-        if self.settings.mongodb is None:
+        settings = _current_settings()
+        if settings.mongodb is None:
             raise ValueError(
                 "MongoDB settings are not configured. "
                 "Please set MONGODB_URL and MONGODB_DATABASE environment variables."
             )
-        self.connection_url = connection_url or self.settings.mongodb.url
-        self.database_name = self.settings.mongodb.database
-        self._client: Optional[AsyncIOMotorClient] = None
-        self._database: Optional[AsyncIOMotorDatabase] = None
-        self._loop_id = None
+        self.connection_url = connection_url or settings.mongodb.url
+        self.database_name = settings.mongodb.database
+        self.driver = settings.mongodb.driver
+        self.validate_on_connect = settings.mongodb.validate_on_connect
+        self._client: Optional["AsyncMongoClient"] = None
+        self._database: Optional["AsyncDatabase"] = None
+        # Loop the current client is bound to; a weakref so a finished loop can be collected
+        self._client_loop: Optional[weakref.ref] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._connect_lock_loop: Optional[weakref.ref] = None
     
     def _is_client_valid_for_current_loop(self) -> bool:
-        if self._client is None:    
-            return False
-        try:
-            current_loop = None
-            try:
-                current_loop = asyncio.get_running_loop()
-            except RuntimeError:
-                try:
-                    current_loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    return False
-            
-            if self._loop_id is not None:
-                try:
-                    stored_loop_id = id(self._loop_id)
-                    current_loop_id = id(current_loop)
-                    return stored_loop_id == current_loop_id
-                except Exception:
-                    return False
-            
-            return True
-        except Exception:
+        if self._client is None:
             return False
+        current_loop = _current_event_loop()
+        return current_loop is not None and self._client_loop is not None and self._client_loop() is current_loop
     
-    async def connect(self):
+    async def connect(self, validate: Optional[bool] = None):
+        # The driver discovers the topology lazily on the first operation; validate forces a round-trip now
+        if validate is None:
+            validate = self.validate_on_connect
+        created = False
         if not self._is_client_valid_for_current_loop():
-            if self._client is not None:
-                try:
-                    self._client.close()
-                except Exception:
-                    pass
-                self._client = None
-                self._database = None
+            # Concurrent first callers wait here instead of each building their own client
+            async with self._get_connect_lock():
+                created = await self._connect(validate)
         
-        if self._client is None:
-            try:
-                try:
-                    current_loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    current_loop = asyncio.get_event_loop()
-                
-                self._client = AsyncIOMotorClient(
+        if validate and not created:
+            # validate always means a round-trip, also for a client that was already connected
+            await self._ping()
+    
+    def _get_connect_lock(self) -> asyncio.Lock:
+        current_loop = asyncio.get_running_loop()
+        if self._connect_lock_loop is None or self._connect_lock_loop() is not current_loop:
+            self._connect_lock = asyncio.Lock()
+            self._connect_lock_loop = weakref.ref(current_loop)
+        return self._connect_lock
+    
+    async def _connect(self, validate: bool) -> bool:
+        # Returns whether a new client was created (and pinged, if validate was set)
+        if not self._is_client_valid_for_current_loop():
+            await self._close_client()
+        
+        if self._client is not None:
+            return False
+        
+        from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+
+        try:
+            current_loop = asyncio.get_running_loop()
+            
+            if self.driver == "mongojet":
+                self._client = await self._create_mongojet_client()
+                self._database = self._client.get_database(self.database_name)
+            else:
+                from pymongo import AsyncMongoClient
+
+                self._client = AsyncMongoClient(
                     self.connection_url,
                     serverSelectionTimeoutMS=5000,
                     maxPoolSize=50,
-                    minPoolSize=10
+                    minPoolSize=10,
+                    maxIdleTimeMS=60000
                 )
-                self._loop_id = current_loop
-                
-                await self._client.admin.command('ping')
                 self._database = self._client[self.database_name]
-                logger.info(f"MongoDB async connection established to database: {self.database_name}")
-            except (ConnectionFailure, ServerSelectionTimeoutError) as e:
-                logger.error(f"Failed to connect to MongoDB: {e}")
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected error connecting to MongoDB: {e}")
-                raise
+            self._client_loop = weakref.ref(current_loop)
+            
+            if validate:
+                await self._ping()
+            _get_logger().info(f"MongoDB async connection established to database: {self.database_name}")
+        except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+            _get_logger().error(f"Failed to connect to MongoDB: {e}")
+            raise
+        except Exception as e:
+            _get_logger().error(f"Unexpected error connecting to MongoDB: {e}")
+            raise
+        return True
+    
+    async def _create_mongojet_client(self):
+        try:
+            from mongojet import create_client
+        except ImportError:
+            raise ImportError("MONGODB_DRIVER=mongojet requires the mongojet package to be installed")
+
+        separator = "&" if "?" in self.connection_url else "?"
+        return await create_client(
+            f"{self.connection_url}{separator}"
+            "serverSelectionTimeoutMS=5000&maxPoolSize=50&minPoolSize=10&maxIdleTimeMS=60000"
+        )
+    
+    async def _ping(self):
+        if self.driver == "mongojet":
+            await self._client.get_database("admin").run_command({"ping": 1})
+        else:
+            await self._client.admin.command('ping')
     
     @property
-    def database(self) -> AsyncIOMotorDatabase:
+    def database(self) -> "AsyncDatabase":
         if self._database is None:
             raise RuntimeError("Database not connected. Call connect() first.")
         return self._database
     
     @property
-    def client(self) -> AsyncIOMotorClient:
+    def client(self) -> "AsyncMongoClient":
         if self._client is None:
             raise RuntimeError("Client not connected. Call connect() first.")
         return self._client
     
+    def _detach_client(self) -> Optional["AsyncMongoClient"]:
+        client = self._client
+        self._client = None
+        self._database = None
+        self._client_loop = None
+        return client
+    
+    async def _close_client(self):
+        client = self._detach_client()
+        if client is not None:
+            try:
+                closing = client.close()
+                if inspect.isawaitable(closing):
+                    await closing
+            except Exception:
+                pass
+    
     async def close(self):
         if self._client:
-            self._client.close()
-            self._client = None
-            self._database = None
-            logger.info("MongoDB async connection closed")
+            await self._close_client()
+            _get_logger().info("MongoDB async connection closed")
     
     async def health_check(self) -> bool:
         try:
-            if self._client is None:
-                await self.connect()
-            
-            try:
-                await self._client.admin.command('ping')
-                logger.debug("MongoDB async health check passed")
-                return True
-            except (RuntimeError, ValueError) as e:
-                error_msg = str(e)
-                if "different loop" in error_msg.lower() or "attached to a different" in error_msg.lower():
-                    logger.warning("MongoDB client attached to different event loop, reconnecting...")
-                    try:
-                        if self._client is not None:
-                            self._client.close()
-                    except Exception:
-                        pass
-                    self._client = None
-                    self._database = None
-                    self._loop_id = None
-                    await self.connect()
-                    await self._client.admin.command('ping')
-                    logger.debug("MongoDB async health check passed after reconnection")
-                    return True
-                else:
-                    raise
+            await self.connect(validate=False)
+            await self._ping()
+            _get_logger().debug("MongoDB async health check passed")
+            return True
         except Exception as e:
-            error_msg = str(e)
-            if "different loop" in error_msg.lower() or "attached to a different" in error_msg.lower():
-                logger.warning("MongoDB client attached to different event loop, reconnecting...")
-                try:
-                    if self._client is not None:
-                        self._client.close()
-                except Exception:
-                    pass
-                self._client = None
-                self._database = None
-                self._loop_id = None
-                try:
-                    await self.connect()
-                    await self._client.admin.command('ping')
-                    logger.debug("MongoDB async health check passed after reconnection")
-                    return True
-                except Exception as reconnect_error:
-                    logger.error(f"MongoDB async health check failed after reconnection attempt: {reconnect_error}")
-                    return False
-            else:
-                logger.error(f"MongoDB async health check failed: {e}")
-                try:
-                    if self._client is not None:
-                        self._client.close()
-                except Exception:
-                    pass
-                self._client = None
-                self._database = None
-                self._loop_id = None
-                return False
+            if isinstance(e, (RuntimeError, ValueError)) and any(token in str(e) for token in _LOOP_TOKENS):
+                _get_logger().warning("MongoDB client attached to different event loop, reconnecting...")
+                return await self._recover_and_ping()
+            _get_logger().error(f"MongoDB async health check failed: {e}")
+            await self._close_client()
+            return False
+    
+    async def _recover_and_ping(self) -> bool:
+        await self._close_client()
+        try:
+            await self.connect(validate=False)
+            await self._ping()
+            _get_logger().debug("MongoDB async health check passed after reconnection")
+            return True
+        except Exception as reconnect_error:
+            _get_logger().error(f"MongoDB async health check failed after reconnection attempt: {reconnect_error}")
+            await self._close_client()
+            return False
+
+
+@lru_cache(maxsize=8)
+def _redis_pool_for(
+    url: str,
+    max_connections: int,
+    decode_responses: bool,
+    socket_timeout: int,
+    socket_connect_timeout: int
+) -> "BlockingConnectionPool":
+    from redis import BlockingConnectionPool
+
+    return BlockingConnectionPool.from_url(
+        url,
+        max_connections=max_connections,
+        timeout=socket_timeout,
+        decode_responses=decode_responses,
+        socket_timeout=socket_timeout,
+        socket_connect_timeout=socket_connect_timeout,
+        socket_keepalive=True
+    )
 
 
 class RedisConnection:
     
     def __init__(self, connection_url: Optional[str] = None):
-        self.settings = get_settings()
-        if self.settings.redis is None:
+        settings = _current_settings()
+        if settings.redis is None:
             raise ValueError(
                 "Redis settings are not configured. "
                 "Please set REDIS_URL environment variable."
             )
-        self.connection_url = connection_url or self.settings.redis.url
-        self._client: Optional[Redis] = None
+        self.connection_url = connection_url or settings.redis.url
+        self._client: Optional["Redis"] = None
     
     def connect(self):
         if self._client is None:
+            from redis import Redis
+            from redis.exceptions import ConnectionError as RedisConnectionError
+
+            settings = _current_settings()
             try:
-                self._client = Redis.from_url(
+                connection_pool = _redis_pool_for(
                     self.connection_url,
-                    decode_responses=self.settings.redis.decode_responses,
-                    socket_timeout=self.settings.redis.socket_timeout,
-                    socket_connect_timeout=self.settings.redis.socket_connect_timeout
+                    settings.redis.pool_size,
+                    settings.redis.decode_responses,
+                    settings.redis.socket_timeout,
+                    settings.redis.socket_connect_timeout
                 )
+                self._client = Redis(connection_pool=connection_pool)
                 # Test connection
                 self._client.ping()
-                logger.info("Redis connection established successfully")
+                self._warm_pool(connection_pool)
+                _get_logger().info("Redis connection established successfully")
             except RedisConnectionError as e:
-                logger.error(f"Failed to connect to Redis: {e}")
+                _get_logger().error(f"Failed to connect to Redis: {e}")
                 raise
     
+    @staticmethod
+    def _warm_pool(connection_pool: "BlockingConnectionPool"):
+        connections = [
+            connection_pool.get_connection("PING")
+            for _ in range(connection_pool.max_connections // 4)
+        ]
+        for connection in connections:
+            connection_pool.release(connection)
+    
     @property
-    def client(self) -> Redis:
+    def client(self) -> "Redis":
         if self._client is None:
             self.connect()
         return self._client
@@ -272,8 +593,9 @@ class RedisConnection:
     def close(self):
         if self._client:
             self._client.close()
+            self._client.connection_pool.disconnect()
             self._client = None
-            logger.info("Redis connection closed")
+            _get_logger().info("Redis connection closed")
     
     def health_check(self) -> bool:
         try:
@@ -281,32 +603,107 @@ class RedisConnection:
                 self.connect()
             return self._client.ping()
         except Exception as e:
-            logger.error(f"Redis health check failed: {e}")
+            _get_logger().error(f"Redis health check failed: {e}")
             return False
 
 
-_postgres_connection: Optional[PostgreSQLConnection] = None
-_async_mongo_connection: Optional[AsyncMongoDBConnection] = None
-_redis_connection: Optional[RedisConnection] = None
+# In LRU order: get_async_mongo moves a loop to the end each time it is used
+_async_mongo_connections: "OrderedDict[asyncio.AbstractEventLoop, AsyncMongoDBConnection]" = OrderedDict()
+_async_mongo_lock = threading.Lock()
+_MAX_ASYNC_MONGO_LOOPS = 32
+
+
+def _evict_async_mongo(loop: asyncio.AbstractEventLoop):
+    client = _async_mongo_connections.pop(loop)._detach_client()
+    if client is None or loop.is_closed():
+        # A closed loop can no longer run AsyncMongoClient.close(); drop the client with it
+        return
+    
+    def close_client():
+        closing = client.close()
+        if inspect.isawaitable(closing):
+            asyncio.ensure_future(closing)
+    
+    try:
+        # The client belongs to that loop, so close it there the next time the loop runs. A loop that is
+        # abandoned without ever running or closing again (e.g. a finished request thread's) never runs
+        # this; its client's sockets are only released when the client is garbage collected.
+        loop.call_soon_threadsafe(close_client)
+    except RuntimeError:
+        pass
+
+
+# Memoized singletons; call e.g. get_postgres.cache_clear() after closing to drop the instance
+@lru_cache(maxsize=None)
+def _get_postgres(database: str) -> PostgreSQLConnection:
+    return PostgreSQLConnection(database=database)
+
 
+@lru_cache(maxsize=None)
+def _get_async_postgres(database: str) -> AsyncPostgreSQLConnection:
+    return AsyncPostgreSQLConnection(database=database)
 
-def get_postgres() -> PostgreSQLConnection:
-    global _postgres_connection
-    if _postgres_connection is None:
-        _postgres_connection = PostgreSQLConnection()
-    return _postgres_connection
 
+# Thin wrappers so get_postgres(), get_postgres("auth") and get_postgres(database="auth") share one cache key
+def get_postgres(database: str = "auth") -> PostgreSQLConnection:
+    return _get_postgres(database)
 
+
+def get_async_postgres(database: str = "auth") -> AsyncPostgreSQLConnection:
+    return _get_async_postgres(database)
+
+
+get_postgres.cache_clear = _get_postgres.cache_clear
+get_async_postgres.cache_clear = _get_async_postgres.cache_clear
+
+
+@lru_cache(maxsize=None)
 def get_redis() -> RedisConnection:
-    global _redis_connection
-    if _redis_connection is None:
-        _redis_connection = RedisConnection()
-    return _redis_connection
+    return RedisConnection()
+
+
+def get_async_mongo() -> AsyncMongoDBConnection:
+    current_loop = _current_event_loop()
+    if current_loop is None:
+        raise RuntimeError("get_async_mongo() must be called with an event loop available")
+    
+    # Threads with their own loops register concurrently; every access reorders or sweeps the shared dict
+    with _async_mongo_lock:
+        connection = _async_mongo_connections.get(current_loop)
+        if connection is not None:
+            _async_mongo_connections.move_to_end(current_loop)
+            return connection
+        
+        for loop in [loop for loop in _async_mongo_connections if loop.is_closed()]:
+            _evict_async_mongo(loop)
+        # Per-thread loops that are never closed would otherwise accumulate: evict the least recently
+        # used idle ones. A loop that is running right now is never evicted, so the cap is soft.
+        idle_loops = [loop for loop in _async_mongo_connections if not loop.is_running()]
+        while len(_async_mongo_connections) >= _MAX_ASYNC_MONGO_LOOPS and idle_loops:
+            _evict_async_mongo(idle_loops.pop(0))
+        connection = AsyncMongoDBConnection()
+        _async_mongo_connections[current_loop] = connection
+    return connection
+
 
 
-def get_async_mongo() -> AsyncMongoDBConnection:    
-    global _async_mongo_connection
-    if _async_mongo_connection is None:
-        _async_mongo_connection = AsyncMongoDBConnection()
-    return _async_mongo_connection
+async def warmup(
+    postgres: bool = False,
+    redis: bool = False,
+    mongo: bool = False,
+    postgres_database: str = "auth"
+) -> None:
+    tasks = {}
+    if postgres:
+        tasks["PostgreSQL"] = asyncio.to_thread(lambda: get_postgres(postgres_database).create_pool())
+    if redis:
+        tasks["Redis"] = asyncio.to_thread(lambda: get_redis().connect())
+    if mongo:
+        tasks["MongoDB"] = get_async_mongo().connect(validate=True)
 
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    for backend, result in zip(tasks, results):
+        if isinstance(result, Exception):
+            _get_logger().warning(f"{backend} warmup failed, connecting lazily on first use: {result}")
+        else:
+            _get_logger().info(f"{backend} connections warmed up")
@@ -1,8 +1,13 @@
+import atexit
 import logging
+import queue
 import sys
 import os
-from datetime import datetime
-from typing import Any, Dict
+import time
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
+import orjson
 from pythonjsonlogger import jsonlogger
 from shared.config import get_settings
 
@@ -10,28 +15,67 @@ settings = get_settings()
 
 log_level = settings.app.log_level
 
+_queue_listener: Optional[QueueListener] = None
+_base_record_factory = logging.getLogRecordFactory()
+
+_RECORD_CONTEXT_FIELDS = (
+    ("service_name", "service"),
+    ("request_id", "request_id"),
+    ("user_id", "user_id"),
+)
+
+_LIBRARY_LOGGERS = ("pika", "urllib3", "psycopg2")
+_PYMONGO_LOGGERS = (
+    "pymongo",
+    "pymongo.topology",
+    "pymongo.connection",
+    "pymongo.serverSelection",
+    "pymongo.command",
+)
+
+def _orjson_dumps(obj: Any, default=None, **kwargs) -> str:
+    # Drop-in for json.dumps in JsonFormatter; cls/indent/ensure_ascii are stdlib-only options
+    return orjson.dumps(
+        obj,
+        default=default or str,
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
+    
+    # (second, ISO prefix) as one tuple so strftime runs once per second and threads never mix the two
+    _last_second = (0, "")
+    
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("json_serializer", _orjson_dumps)
+        super().__init__(*args, **kwargs)
 
     def add_fields(self, log_record: Dict[str, Any], record: logging.LogRecord, message_dict: Dict[str, Any]):
         super().add_fields(log_record, record, message_dict)
         
-        log_record['timestamp'] = datetime.utcnow().isoformat()
-        
+        log_record['timestamp'] = self._format_timestamp(record.created)
         log_record['level'] = record.levelname
-        
         log_record['logger'] = record.name
-        
         log_record['pid'] = record.process
         
         if record.exc_info:
             log_record['exception'] = self.formatException(record.exc_info)
         
-        if hasattr(record, 'service_name'):
-            log_record['service'] = record.service_name
-        if hasattr(record, 'request_id'):
-            log_record['request_id'] = record.request_id
-        if hasattr(record, 'user_id'):
-            log_record['user_id'] = record.user_id
+        # Plain dict probes on the record's __dict__ instead of one hasattr() per optional field
+        record_dict = record.__dict__
+        for attr, key in _RECORD_CONTEXT_FIELDS:
+            if attr in record_dict:
+                log_record[key] = record_dict[attr]
+    
+    @classmethod
+    def _format_timestamp(cls, created: float) -> str:
+        sec = int(created)
+        last_sec, prefix = cls._last_second
+        if sec != last_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            cls._last_second = (sec, prefix)
+        return f"{prefix}.{int((created - sec) * 1e6):06d}"
 
 
 def setup_logging(
@@ -44,7 +88,7 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.handlers = []
     
-    level = getattr(logging, log_level.upper(), "DEBUG")
+    level = logging.getLevelNamesMapping().get(log_level.upper(), logging.DEBUG)
     root_logger.setLevel(level)
     
     if json_output:
@@ -58,31 +102,86 @@ def setup_logging(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
     
+    log_queue = queue.SimpleQueue()
+    handlers = []
+    
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _BufferedFileHandler(log_file, log_queue)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
-    for handler in root_logger.handlers:
-        handler.addFilter(ServiceNameFilter(service_name))
+    _install_service_name_factory(service_name)
+    _start_queue_listener(root_logger, log_queue, handlers)
 
-    logging.getLogger("pika").setLevel(level)
-    logging.getLogger("urllib3").setLevel(level)
-    logging.getLogger("psycopg2").setLevel(level)
+    for name in _LIBRARY_LOGGERS:
+        logging.getLogger(name).setLevel(level)
     
-    logging.getLogger("pymongo").setLevel(logging.INFO)
-    logging.getLogger("pymongo.topology").setLevel(logging.INFO)
-    logging.getLogger("pymongo.connection").setLevel(logging.INFO)
-    logging.getLogger("pymongo.serverSelection").setLevel(logging.INFO)
-    logging.getLogger("pymongo.command").setLevel(logging.INFO)
+    for name in _PYMONGO_LOGGERS:
+        logging.getLogger(name).setLevel(logging.INFO)
     
-    logging.info(f"Logging configured for service: {service_name}", extra={"service_name": service_name})
+    logging.info(f"Logging configured for service: {service_name}")
+
+
+def _install_service_name_factory(service_name: str):
+    # Stamp service_name once at record creation instead of running a filter per handler
+    def factory(*args, **kwargs) -> logging.LogRecord:
+        record = _base_record_factory(*args, **kwargs)
+        record.service_name = service_name
+        return record
+    
+    logging.setLogRecordFactory(factory)
+
+
+class _LocalQueueHandler(QueueHandler):
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Freeze msg % args now, before the caller can mutate the args; exc_info stays for the listener's formatter
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    
+    def __init__(self, filename: str, log_queue: queue.SimpleQueue):
+        self._log_queue = log_queue
+        super().__init__(filename, encoding="utf-8")
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, errors=self.errors, buffering=65536)
+    
+    def flush(self):
+        # Let bursts accumulate in the 64 KiB buffer; write through once the listener has drained the queue
+        if self._log_queue.empty():
+            super().flush()
+
+
+def _start_queue_listener(root_logger: logging.Logger, log_queue: queue.SimpleQueue, handlers: List[logging.Handler]):
+    global _queue_listener
+    stop_logging()
+    
+    root_logger.addHandler(_LocalQueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+
+def stop_logging():
+    global _queue_listener
+    if _queue_listener is not None:
+        # stop() drains the queue first, so the handlers can be closed safely afterwards
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(stop_logging)
 
 
 class ServiceNameFilter(logging.Filter):
@@ -96,13 +195,10 @@ class ServiceNameFilter(logging.Filter):
         return True
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str, service_name: str = None) -> logging.Logger:
-
-    logger = logging.getLogger(name)
-    if service_name:
-        for handler in logger.handlers:
-            handler.addFilter(ServiceNameFilter(service_name))
-    return logger
+    # service_name is stamped on every record by the factory installed in setup_logging
+    return logging.getLogger(name)
 
 
 class RequestContextFilter(logging.Filter):
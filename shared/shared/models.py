@@ -30,6 +30,10 @@ class BaseMessage(BaseModel):
     source_service: str = Field(..., description="Service that generated the message")
     correlation_id: Optional[str] = Field(None, description="Correlation ID for request tracing")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    
+    def to_json_bytes(self) -> bytes:
+        # Each subclass carries its own compiled pydantic-core serializer; use it directly
+        return self.__pydantic_serializer__.to_json(self)
 
 
 class OrderMessage(BaseMessage):
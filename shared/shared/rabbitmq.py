@@ -1,47 +1,100 @@
-import json
 import logging
 import asyncio
-from typing import Callable, Optional, Dict, Any, List
-from functools import wraps
+import random
+from concurrent.futures import Executor
+from typing import Callable, Optional, Dict, Any, List, Iterable, Tuple
+from functools import partial, wraps
 
 import aio_pika
+import orjson
 from aio_pika import Message, DeliveryMode
 from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractExchange
-from aio_pika.exceptions import AMQPConnectionError, AMQPChannelError
+from aio_pika.exceptions import AMQPConnectionError, AMQPChannelError, ChannelInvalidStateError
+from pamqp.commands import Basic
 
 from .config import get_settings
-from .models import BaseMessage
+from .models import BaseMessage, MessageType
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+MSGPACK_CONTENT_TYPE = 'application/msgpack'
+
+# At-most-once is acceptable for these; everything else keeps publisher confirms
+FIRE_AND_FORGET_TYPES = frozenset({
+    MessageType.NOTIFICATION_SENT.value,
+    MessageType.PRODUCT_UPDATED.value,
+})
+
+# Fixed Message properties bound once instead of re-passed on every publish
+_json_message = partial(Message, delivery_mode=DeliveryMode.PERSISTENT, content_type='application/json')
+_msgpack_message = partial(Message, delivery_mode=DeliveryMode.PERSISTENT, content_type=MSGPACK_CONTENT_TYPE)
+
+# Shared wire-level properties for publish_many; pamqp only reads them when marshalling a frame
+_JSON_PROPERTIES = Basic.Properties(delivery_mode=DeliveryMode.PERSISTENT.value, content_type='application/json')
+_MSGPACK_PROPERTIES = Basic.Properties(delivery_mode=DeliveryMode.PERSISTENT.value, content_type=MSGPACK_CONTENT_TYPE)
+
+# content_type -> (Message factory, shared frame properties)
+_WIRE_FORMATS = {
+    'application/json': (_json_message, _JSON_PROPERTIES),
+    MSGPACK_CONTENT_TYPE: (_msgpack_message, _MSGPACK_PROPERTIES),
+}
+
+
+class MessageDecodeError(ValueError):
+    pass
+
+
+def decode_message_body(message: aio_pika.IncomingMessage) -> Dict[str, Any]:
+    # Dispatch on content_type so JSON and msgpack publishers can share a queue during rollout
+    try:
+        if message.content_type == MSGPACK_CONTENT_TYPE:
+            import msgpack
+
+            return msgpack.unpackb(message.body, raw=False)
+        return orjson.loads(message.body)
+    except ValueError as e:
+        raise MessageDecodeError(f"Failed to decode {message.content_type or 'message'} body: {e}") from e
+
 
 class RabbitMQConnection:
     
     def __init__(self, connection_url: Optional[str] = None):
-        self.settings = get_settings()
+        self.settings = settings
         self.connection_url = connection_url or self.settings.rabbitmq.url
         self._connection: Optional[AbstractConnection] = None
         self._channel: Optional[AbstractChannel] = None
         self._exchange: Optional[AbstractExchange] = None
+        self._fast_channel: Optional[AbstractChannel] = None
+        self._fast_exchange: Optional[AbstractExchange] = None
+        self._connect_lock = asyncio.Lock()
+        self._fast_channel_lock = asyncio.Lock()
     
     async def connect(self):    
         if self._connection is None or self._connection.is_closed:
-            try:
-                self._connection = await aio_pika.connect_robust(self.connection_url)
-                self._channel = await self._connection.channel()
-                
-                self._exchange = await self._channel.declare_exchange(
-                    self.settings.rabbitmq.exchange,
-                    aio_pika.ExchangeType.TOPIC,
-                    durable=True
-                )
-                
-                logger.info("RabbitMQ connection established successfully")
-            except AMQPConnectionError as e:
-                logger.error(f"Failed to connect to RabbitMQ: {e}")
-                raise
+            # Concurrent first publishers wait for one connection instead of each opening their own
+            async with self._connect_lock:
+                if self._connection is None or self._connection.is_closed:
+                    await self._connect()
         return self._connection
     
+    async def _connect(self):
+        try:
+            self._connection = await aio_pika.connect_robust(self.connection_url)
+            self._channel = await self._connection.channel()
+            
+            self._exchange = await self._channel.declare_exchange(
+                self.settings.rabbitmq.exchange,
+                aio_pika.ExchangeType.TOPIC,
+                durable=True
+            )
+            
+            logger.info("RabbitMQ connection established successfully")
+        except AMQPConnectionError as e:
+            logger.error(f"Failed to connect to RabbitMQ: {e}")
+            raise
+    
     async def get_channel(self) -> AbstractChannel: 
         if self._channel is None or self._channel.is_closed:
             await self.connect()
@@ -52,12 +105,30 @@ class RabbitMQConnection:
             await self.connect()
         return self._exchange
     
+    async def get_fast_exchange(self) -> AbstractExchange:
+        if self._fast_channel is None or self._fast_channel.is_closed:
+            async with self._fast_channel_lock:
+                if self._fast_channel is None or self._fast_channel.is_closed:
+                    connection = await self.connect()
+                    # No publisher confirms: publishes don't wait for a broker ack, so delivery is at-most-once
+                    self._fast_channel = await connection.channel(publisher_confirms=False)
+                    self._fast_exchange = await self._fast_channel.get_exchange(
+                        self.settings.rabbitmq.exchange, ensure=False
+                    )
+        return self._fast_exchange
+    
     async def close(self):
         try:
+            if self._fast_channel and not self._fast_channel.is_closed:
+                await self._fast_channel.close()
             if self._channel and not self._channel.is_closed:
                 await self._channel.close()
             if self._connection and not self._connection.is_closed:
                 await self._connection.close()
+            self._channel = None
+            self._exchange = None
+            self._fast_channel = None
+            self._fast_exchange = None
             logger.info("RabbitMQ connection closed")
         except Exception as e:
             logger.error(f"Error closing RabbitMQ connection: {e}")
@@ -75,51 +146,211 @@ class RabbitMQConnection:
 class RabbitMQPublisher:    
     
     def __init__(self, connection: Optional[RabbitMQConnection] = None):
-        self.connection = connection or RabbitMQConnection()
-        self.settings = get_settings()
+        self.connection = connection or get_rabbitmq()
+        self.settings = settings
+        self._exchange: Optional[AbstractExchange] = None
+    
+    async def _get_exchange(self) -> AbstractExchange:
+        # Robust exchanges survive reconnects; only re-resolve after close() or a failed publish
+        if self._exchange is None or self._exchange is not self.connection._exchange:
+            self._exchange = await self.connection.get_exchange()
+        return self._exchange
+    
+    def _encode(self, message: BaseMessage) -> Tuple[bytes, str]:
+        # Single place that picks the wire format, shared by the Message and raw-frame publish paths
+        if self.settings.rabbitmq.wire_format == "msgpack":
+            import msgpack
+
+            return msgpack.packb(message.model_dump(mode='json'), use_bin_type=True), MSGPACK_CONTENT_TYPE
+        return message.to_json_bytes(), 'application/json'
+    
+    def _build_message(self, message: BaseMessage) -> Message:
+        body, content_type = self._encode(message)
+        message_factory, _ = _WIRE_FORMATS[content_type]
+        return message_factory(body, correlation_id=message.correlation_id)
+    
+    def _build_frame(self, message: BaseMessage) -> Tuple[bytes, Basic.Properties]:
+        body, content_type = self._encode(message)
+        _, properties = _WIRE_FORMATS[content_type]
+        if message.correlation_id is not None:
+            properties = Basic.Properties(
+                delivery_mode=properties.delivery_mode,
+                content_type=content_type,
+                correlation_id=message.correlation_id,
+            )
+        return body, properties
     
     async def publish(self, message: BaseMessage, routing_key: Optional[str] = None):
         try:
-            exchange = await self.connection.get_exchange()
-            routing_key = routing_key or message.message_type.value
+            exchange = await self._get_exchange()
+            # use_enum_values stores message_type as the plain routing string already
+            routing_key = routing_key or message.message_type
             
-            message_body = message.model_dump_json()
+            await exchange.publish(self._build_message(message), routing_key=routing_key)
             
-            await exchange.publish(
-                Message(
-                    message_body.encode(),
-                    delivery_mode=DeliveryMode.PERSISTENT,
-                    content_type='application/json',
-                    correlation_id=message.correlation_id,
-                ),
-                routing_key=routing_key,
-            )
+            logger.debug("Published message %s with routing key %s", message.message_id, routing_key)
+        except (AMQPConnectionError, AMQPChannelError) as e:
+            self._exchange = None
+            logger.error(f"Failed to publish message: {e}")
+            raise
+    
+    async def publish_fire_and_forget(self, message: BaseMessage, routing_key: Optional[str] = None):
+        if message.message_type not in FIRE_AND_FORGET_TYPES:
+            await self.publish(message, routing_key)
+            return
+        
+        try:
+            exchange = await self.connection.get_fast_exchange()
+            routing_key = routing_key or message.message_type
+            
+            await exchange.publish(self._build_message(message), routing_key=routing_key)
             
-            logger.info(f"Published message {message.message_id} with routing key {routing_key}")
+            logger.debug("Published message %s without confirm, routing key %s", message.message_id, routing_key)
         except (AMQPConnectionError, AMQPChannelError) as e:
             logger.error(f"Failed to publish message: {e}")
             raise
     
+    async def publish_many(self, messages: List[BaseMessage], routing_key: Optional[str] = None):
+        try:
+            exchange = await self._get_exchange()
+            underlay = await self._get_open_underlay_channel()
+            
+            if underlay is None:
+                # Mid-reconnect: exchange.publish waits for the robust channel to come back
+                messages_out = [self._build_message(message) for message in messages]
+                await asyncio.gather(*[
+                    exchange.publish(message_out, routing_key=routing_key or message.message_type)
+                    for message, message_out in zip(messages, messages_out)
+                ])
+            else:
+                # Encode everything up front, then publish straight on the aiormq channel
+                # so no aio_pika Message or header normalisation is built per message
+                frames = [self._build_frame(message) for message in messages]
+                await asyncio.gather(*[
+                    underlay.basic_publish(
+                        body,
+                        exchange=exchange.name,
+                        routing_key=routing_key or message.message_type,
+                        properties=properties,
+                    )
+                    for message, (body, properties) in zip(messages, frames)
+                ])
+            
+            logger.debug("Published %d messages", len(messages))
+        except (AMQPConnectionError, AMQPChannelError, ChannelInvalidStateError) as e:
+            self._exchange = None
+            logger.error(f"Failed to publish messages: {e}")
+            raise
+    
+    async def _get_open_underlay_channel(self):
+        # None while the robust channel is reconnecting; basic_publish there would fail instead of waiting
+        channel = await self.connection.get_channel()
+        try:
+            underlay = await channel.get_underlay_channel()
+        except ChannelInvalidStateError:
+            return None
+        return None if underlay.is_closed else underlay
+    
     async def publish_raw(self, message_body: str, routing_key: str, headers: Optional[Dict[str, Any]] = None):
         try:
-            exchange = await self.connection.get_exchange()
+            exchange = await self._get_exchange()
             
             await exchange.publish(
-                Message(
-                    message_body.encode(),
-                    delivery_mode=DeliveryMode.PERSISTENT,
-                    content_type='application/json',
-                    headers=headers or {},
-                ),
+                _json_message(message_body.encode(), headers=headers),
                 routing_key=routing_key,
             )
             
-            logger.info(f"Published raw message with routing key {routing_key}")
+            logger.debug("Published raw message with routing key %s", routing_key)
         except (AMQPConnectionError, AMQPChannelError) as e:
+            self._exchange = None
             logger.error(f"Failed to publish raw message: {e}")
             raise
 
 
+# Needs a long-lived running event loop: the flush task only runs while that loop does.
+# Don't use it from code that runs each request to completion on a short-lived loop.
+class RabbitMQCoalescingPublisher(RabbitMQPublisher):
+    
+    def __init__(
+        self,
+        connection: Optional[RabbitMQConnection] = None,
+        flush_interval_ms: int = 50,
+        coalesce_types: Iterable[str] = (MessageType.INVENTORY_UPDATED.value,)
+    ):
+        super().__init__(connection)
+        self.flush_interval = flush_interval_ms / 1000
+        self.coalesce_types = frozenset(coalesce_types)
+        self._buffer: Dict[Tuple[str, str], BaseMessage] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    async def publish(self, message: BaseMessage, routing_key: Optional[str] = None):
+        product_id = getattr(message, 'product_id', None)
+        if message.message_type not in self.coalesce_types or product_id is None:
+            await super().publish(message, routing_key)
+            return
+        
+        routing_key = routing_key or message.message_type
+        self._merge((routing_key, product_id), message)
+        
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    def _merge(self, key: Tuple[str, str], message: BaseMessage):
+        previous = self._buffer.get(key)
+        if previous is not None:
+            # Totals are last-write-wins, but a delta must cover every update the merged message replaces;
+            # types without quantity_change (e.g. ProductMessage) are plain last-write-wins
+            previous_change = getattr(previous, 'quantity_change', None)
+            current_change = getattr(message, 'quantity_change', None)
+            if previous_change is not None and current_change is not None:
+                message = message.model_copy(update={'quantity_change': previous_change + current_change})
+        self._buffer[key] = message
+    
+    def _requeue(self, unsent: List[Tuple[Tuple[str, str], BaseMessage]]):
+        # Unsent messages are older than anything buffered since the flush began, so merge the newer ones on top
+        newer, self._buffer = self._buffer, dict(unsent)
+        for key, message in newer.items():
+            self._merge(key, message)
+    
+    async def _flush_loop(self):
+        while self._buffer:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush coalesced messages, will retry: {e}")
+    
+    async def flush(self):
+        buffer, self._buffer = self._buffer, {}
+        if not buffer:
+            return
+        
+        by_routing_key: Dict[str, List[Tuple[Tuple[str, str], BaseMessage]]] = {}
+        for key, message in buffer.items():
+            by_routing_key.setdefault(key[0], []).append((key, message))
+        
+        pending = list(by_routing_key.items())
+        try:
+            while pending:
+                routing_key, items = pending[0]
+                await self.publish_many([message for _, message in items], routing_key=routing_key)
+                pending.pop(0)
+        except BaseException:
+            # A failed or cancelled batch goes back in the buffer; a partly sent batch may be delivered twice
+            self._requeue([item for _, items in pending for item in items])
+            raise
+    
+    async def close(self):
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        await self.flush()
+
+
 class RabbitMQConsumer:
     
     def __init__(
@@ -127,18 +358,26 @@ class RabbitMQConsumer:
         queue_name: str,
         routing_keys: List[str],
         connection: Optional[RabbitMQConnection] = None,
-        callback: Optional[Callable] = None
+        callback: Optional[Callable] = None,
+        executor: Optional[Executor] = None
     ):
-        self.connection = connection or RabbitMQConnection()
-        self.settings = get_settings()
+        self.connection = connection or get_rabbitmq()
+        self.settings = settings
         self.queue_name = f"{self.settings.rabbitmq.queue_prefix}.{queue_name}"
         self.routing_keys = routing_keys
         self.callback = callback
+        self.executor = executor
+        self._channel: Optional[AbstractChannel] = None
         self._queue: Optional[aio_pika.abc.AbstractQueue] = None
     
     async def setup_queue(self):
-        channel = await self.connection.get_channel()
         exchange = await self.connection.get_exchange()
+        connection = await self.connection.connect()
+        
+        # Dedicated channel so QoS/deliveries don't interleave with shared publishers
+        if self._channel is None or self._channel.is_closed:
+            self._channel = await connection.channel()
+        channel = self._channel
         
         self._queue = await channel.declare_queue(self.queue_name, durable=True)
         
@@ -151,18 +390,24 @@ class RabbitMQConsumer:
     
     async def process_message(self, message: aio_pika.IncomingMessage):
         try:
-            message_data = json.loads(message.body.decode('utf-8'))
-            logger.info(f"Received message: {message_data.get('message_id', 'unknown')}")
+            message_data = decode_message_body(message)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received message: %s", message_data.get('message_id', 'unknown'))
             
             if self.callback:
                 if asyncio.iscoroutinefunction(self.callback):
                     await self.callback(message_data, message.properties, message)
+                elif self.executor is not None:
+                    await asyncio.get_running_loop().run_in_executor(
+                        self.executor,
+                        partial(self.callback, message_data, message.properties, message)
+                    )
                 else:
                     self.callback(message_data, message.properties, message)
             
             await message.ack()
             
-        except json.JSONDecodeError as e:   
+        except MessageDecodeError as e:   
             logger.error(f"Failed to decode message: {e}")
             await message.nack(requeue=False)  
         except Exception as e:
@@ -180,11 +425,23 @@ class RabbitMQConsumer:
         try:
             if self._queue:
                 await self._queue.cancel()
+            if self._channel and not self._channel.is_closed:
+                await self._channel.close()
             logger.info("Stopped consuming messages")
         except Exception as e:
             logger.error(f"Error stopping consumer: {e}")
 
 
+_rabbitmq_connection: Optional[RabbitMQConnection] = None
+
+
+def get_rabbitmq() -> RabbitMQConnection:
+    global _rabbitmq_connection
+    if _rabbitmq_connection is None:
+        _rabbitmq_connection = RabbitMQConnection()
+    return _rabbitmq_connection
+
+
 def retry_on_connection_error(max_retries: int = 3):
     def decorator(func: Callable):
         @wraps(func)
@@ -196,7 +453,8 @@ def retry_on_connection_error(max_retries: int = 3):
                     if attempt == max_retries - 1:
                         raise
                     logger.warning(f"Connection error (attempt {attempt + 1}/{max_retries}): {e}")
-                    await asyncio.sleep(2 ** attempt)  
+                    # Capped, jittered delay so consumers don't all reconnect in lockstep after a broker restart
+                    await asyncio.sleep(min(30, 2 ** attempt) * (0.5 + random.random()))
             return None
         return wrapper
     return decorator
@@ -0,0 +1,13 @@
+import os
+
+os.environ.setdefault("APP_NAME", "theone-shared-tests")
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("LOG_LEVEL", "INFO")
+os.environ.setdefault("SERVICE_NAME", "shared-tests")
+os.environ.setdefault("JSON_OUTPUT", "false")
+os.environ.setdefault("LOG_FILE", "")
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-for-testing-only")
+os.environ.setdefault("JWT_ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "15")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "7")
@@ -0,0 +1,125 @@
+import pytest
+
+from shared.models import InventoryMessage, MessageType, OrderMessage, ProductMessage
+from shared.rabbitmq import RabbitMQCoalescingPublisher, RabbitMQPublisher
+
+
+class RecordingPublisher(RabbitMQCoalescingPublisher):
+    
+    def __init__(self, **kwargs):
+        super().__init__(connection=object(), **kwargs)
+        self.batches = []
+        self.fail_next = False
+    
+    async def publish_many(self, messages, routing_key=None):
+        if self.fail_next:
+            self.fail_next = False
+            raise ConnectionError("broker unavailable")
+        self.batches.append((routing_key, list(messages)))
+
+
+def inventory_message(product_id: str, quantity_change: int, total_stock: int) -> InventoryMessage:
+    return InventoryMessage(
+        message_id=f"{product_id}-{total_stock}",
+        message_type=MessageType.INVENTORY_UPDATED,
+        source_service="product-service",
+        product_id=product_id,
+        quantity_change=quantity_change,
+        total_stock=total_stock,
+        reserved_stock=0,
+        available_stock=total_stock,
+    )
+
+
+class TestCoalescingPublisher:
+    
+    @pytest.mark.asyncio
+    async def test_merges_quantity_change_and_keeps_latest_totals(self):
+        publisher = RecordingPublisher(flush_interval_ms=60_000)
+        
+        await publisher.publish(inventory_message("p1", 2, 12), "inventory.updated")
+        await publisher.publish(inventory_message("p1", -5, 7), "inventory.updated")
+        await publisher.publish(inventory_message("p2", 1, 1), "inventory.updated")
+        await publisher.close()
+        
+        assert len(publisher.batches) == 1
+        routing_key, messages = publisher.batches[0]
+        assert routing_key == "inventory.updated"
+        by_product = {message.product_id: message for message in messages}
+        assert by_product["p1"].quantity_change == -3
+        assert by_product["p1"].total_stock == 7
+        assert by_product["p2"].quantity_change == 1
+    
+    @pytest.mark.asyncio
+    async def test_other_message_types_pass_through(self, monkeypatch):
+        sent = []
+        
+        async def fake_publish(self, message, routing_key=None):
+            sent.append((message, routing_key))
+        
+        monkeypatch.setattr(RabbitMQPublisher, "publish", fake_publish)
+        publisher = RecordingPublisher(flush_interval_ms=60_000)
+        message = OrderMessage(
+            message_id="o1",
+            message_type=MessageType.ORDER_CREATED,
+            source_service="order-service",
+            order_id="o1",
+            user_id="u1",
+            status="pending",
+            total_amount=10.0,
+        )
+        
+        await publisher.publish(message, "order.created")
+        await publisher.close()
+        
+        assert sent == [(message, "order.created")]
+        assert publisher.batches == []
+    
+    @pytest.mark.asyncio
+    async def test_close_flushes_remaining_messages(self):
+        publisher = RecordingPublisher(flush_interval_ms=60_000)
+        
+        await publisher.publish(inventory_message("p1", 3, 3))
+        assert publisher.batches == []
+        
+        await publisher.close()
+        
+        assert [message.product_id for _, messages in publisher.batches for message in messages] == ["p1"]
+        assert publisher.batches[0][0] == MessageType.INVENTORY_UPDATED.value
+    
+    @pytest.mark.asyncio
+    async def test_types_without_quantity_change_keep_last_message(self):
+        publisher = RecordingPublisher(
+            flush_interval_ms=60_000,
+            coalesce_types=(MessageType.PRODUCT_UPDATED.value,),
+        )
+        for price in (10.0, 12.5):
+            await publisher.publish(ProductMessage(
+                message_id=f"p1-{price}",
+                message_type=MessageType.PRODUCT_UPDATED,
+                source_service="product-service",
+                product_id="p1",
+                name="Product 1",
+                price=price,
+                stock=3,
+            ))
+        await publisher.close()
+        
+        (_, messages), = publisher.batches
+        assert [message.price for message in messages] == [12.5]
+    
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_messages_buffered(self):
+        publisher = RecordingPublisher(flush_interval_ms=60_000)
+        await publisher.publish(inventory_message("p1", 2, 2), "inventory.updated")
+        
+        publisher.fail_next = True
+        with pytest.raises(ConnectionError):
+            await publisher.flush()
+        
+        await publisher.publish(inventory_message("p1", 3, 5), "inventory.updated")
+        await publisher.close()
+        
+        (_, messages), = publisher.batches
+        assert messages[0].quantity_change == 5
+        assert messages[0].total_stock == 5